@@ -2,6 +2,7 @@ import os
 import time
 import sys
 import ctypes
+import struct
 from ctypes import byref, c_int, c_uint, c_ubyte, c_char_p, c_void_p
 
 # ===== User config =====
@@ -33,6 +34,10 @@ PS_OK, PS_COMM_ERR, PS_NO_FINGER = 0x00, 0x01, 0x02
 IMAGE_X, IMAGE_Y = 256, 288
 IMAGE_BYTES = IMAGE_X * IMAGE_Y
 
+# ===== stdout framing (read by main.go) =====
+FRAME_MAGIC = 0x52333037  # "R307"
+FRAME_HEADER = struct.Struct(">IHH")  # magic, width, height
+
 # ===== Function signatures we use (subset) =====
 dll.PSOpenDeviceEx.argtypes = [
     ctypes.POINTER(HANDLE),
@@ -107,10 +112,13 @@ def try_USB_explicit() -> HANDLE:
         rc = dll.PSOpenDeviceEx(byref(h), DEVICE_USB, 1, 1, nPackageSize, 0)
         tried.append((nPackageSize, rc))
         if rc == PS_OK and h:
-            print(f"[USB] Open OK with nPackageSize={nPackageSize}")
+            print(f"[USB] Open OK with nPackageSize={nPackageSize}", file=sys.stderr)
             return h
         else:
-            print(f"[USB] Open failed (nPackageSize={nPackageSize}) → {err_text(rc)}")
+            print(
+                f"[USB] Open failed (nPackageSize={nPackageSize}) → {err_text(rc)}",
+                file=sys.stderr,
+            )
     raise RuntimeError(
         "USB open attempts failed: "
         + ", ".join(f"ps={ps}:{err_text(rc)}" for ps, rc in tried)
@@ -127,12 +135,15 @@ def try_COM_scan() -> HANDLE:
             h = HANDLE()
             rc = dll.PSOpenDeviceEx(byref(h), DEVICE_COM, com, ibaud, 2, 0)
             if rc == PS_OK and h:
-                print(f"[COM] Open OK on COM{com} @ {ibaud*9600} bps")
+                print(f"[COM] Open OK on COM{com} @ {ibaud*9600} bps", file=sys.stderr)
                 return h
             else:
                 # Reduce noise—only show likely ports (under 15) or last tried
                 if com <= 15 or (com == 30 and ibaud == 12):
-                    print(f"[COM] COM{com} @ {ibaud*9600} → {err_text(rc)}")
+                    print(
+                        f"[COM] COM{com} @ {ibaud*9600} → {err_text(rc)}",
+                        file=sys.stderr,
+                    )
     raise RuntimeError("COM open attempts failed.")
 
 
@@ -144,10 +155,10 @@ def open_device_resilient() -> tuple[HANDLE, str]:
     # Quick visibility: how many USB/UDisk devices the DLL sees
     usb_n = c_int(0)
     if dll.PSGetUSBDevNum(byref(usb_n)) == PS_OK:
-        print(f"DLL reports USB devices: {usb_n.value}")
+        print(f"DLL reports USB devices: {usb_n.value}", file=sys.stderr)
     udisks = c_int(0)
     if dll.PSGetUDiskNum(byref(udisks)) == PS_OK:
-        print(f"DLL reports UDISK devices: {udisks.value}")
+        print(f"DLL reports UDISK devices: {udisks.value}", file=sys.stderr)
 
     # 1) PSAutoOpen (preferred)
     try:
@@ -157,17 +168,17 @@ def open_device_resilient() -> tuple[HANDLE, str]:
             if dtype == DEVICE_USB
             else ("COM" if dtype == DEVICE_COM else f"type={dtype}")
         )
-        print(f"PSAutoOpen succeeded. Mode: {mode}")
+        print(f"PSAutoOpen succeeded. Mode: {mode}", file=sys.stderr)
         return h, mode
     except Exception as e:
-        print(str(e))
+        print(str(e), file=sys.stderr)
 
     # 2) USB explicit with packet-size variants
     try:
         h = try_USB_explicit()
         return h, "USB"
     except Exception as e:
-        print(str(e))
+        print(str(e), file=sys.stderr)
 
     # 3) COM scan
     h = try_COM_scan()
@@ -175,16 +186,17 @@ def open_device_resilient() -> tuple[HANDLE, str]:
 
 
 # ===== Capture helpers =====
-def wait_for_finger_and_capture(h: HANDLE, addr: int, timeout_s: int) -> bytes:
-    t0 = time.time()
+def wait_for_finger_and_capture(h: HANDLE, addr: int, timeout_s: int) -> memoryview:
+    deadline = time.monotonic() + timeout_s
     while True:
         rc = dll.PSGetImage(h, addr)
         if rc == PS_OK:
             break
         if rc == PS_NO_FINGER:
-            if time.time() - t0 > timeout_s:
+            if time.monotonic() > deadline:
                 raise TimeoutError("No finger detected within timeout.")
-            time.sleep(0.15)
+            # PSGetImage's own round-trip paces the loop, keep the extra gap short
+            time.sleep(0.01)
             continue
         raise RuntimeError(f"PSGetImage failed: {err_text(rc)}")
 
@@ -193,25 +205,34 @@ def wait_for_finger_and_capture(h: HANDLE, addr: int, timeout_s: int) -> bytes:
     rc = dll.PSUpImage(h, addr, img_buf, byref(img_len))
     if rc != PS_OK:
         raise RuntimeError(f"PSUpImage failed: {err_text(rc)}")
-    return bytes(bytearray(img_buf)[: img_len.value])
+    # PSUpImage already returns 8-bit pixels; hand back a view, no copy
+    return memoryview(img_buf).cast("B")[: img_len.value]
 
 
-def save_bmp_via_dll(img_bytes: bytes, out_path: str):
+def save_bmp_via_dll(img_bytes: bytes | memoryview, out_path: str):
     buf = (c_ubyte * len(img_bytes)).from_buffer_copy(img_bytes)
     rc = dll.PSImgData2BMP(buf, out_path.encode("utf-8"))
     if rc != PS_OK:
         raise RuntimeError(f"PSImgData2BMP failed: {err_text(rc)}")
 
 
+def send_image_to_stdout(bytes8: bytes | memoryview, width=IMAGE_X, height=IMAGE_Y):
+    """Write the 8-bit grayscale frame to stdout behind an 8-byte header."""
+    out = sys.stdout.buffer
+    out.write(FRAME_HEADER.pack(FRAME_MAGIC, width, height))
+    out.write(bytes8)
+    out.flush()
+
+
 # ===== Main =====
 def main():
-    print("Opening fingerprint device …")
+    print("Opening fingerprint device …", file=sys.stderr)
     h = None
     try:
         h, mode = open_device_resilient()
         img = wait_for_finger_and_capture(h, DEFAULT_ADDR, TIMEOUT_SECONDS)
         send_image_to_stdout(img)
-        print("Done.")
+        print("Done.", file=sys.stderr)
     finally:
         close_device(h)
 
@@ -219,16 +240,3 @@ def main():
 if __name__ == "__main__":
     main()
 
-
-def send_image_to_stdout(bytes8: bytes, width=256, height=288):
-    try:
-        from PIL import Image
-
-        img = Image.frombytes("L", (width, height), bytes8)
-        img.save(sys.stdout.buffer, "PNG", quality=100)
-        img.close()
-
-        return
-    except Exception as e:
-        print(f"Pillow save error: {e}")
-        print("⚠️ Pillow save failed;")
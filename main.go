@@ -2,6 +2,11 @@ package main
 
 import (
 	"bytes"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"image"
+	"image/png"
 	"io"
 	"log"
 	"net/http"
@@ -14,6 +19,19 @@ import (
 
 const pythonScript = "capture.py"
 
+// frameMagic marks the header capture.py writes before the raw pixels ("R307")
+const frameMagic = 0x52333037
+
+// frameHeader mirrors FRAME_HEADER in capture.py
+type frameHeader struct {
+	Magic  uint32
+	Width  uint16
+	Height uint16
+}
+
+// 256x288 8-bit frame plus its header
+var captureBufSize = 256*288 + binary.Size(frameHeader{})
+
 func main() {
 	http.HandleFunc("GET /capture", corsMiddleWare(HandleCapture))
 	log.Println("Starting server on http://localhost:8080")
@@ -47,6 +65,8 @@ func HandleCapture(w http.ResponseWriter, r *http.Request) {
 	cmd := exec.Command(pythonExec, pythonScript)
 
 	var stdoutBuf, stderrBuf bytes.Buffer
+	// size it once so reading the frame doesn't regrow and copy the buffer
+	stdoutBuf.Grow(captureBufSize)
 	cmd.Stdout = &stdoutBuf
 	// will get nice python panics with this baby
 	cmd.Stderr = &stderrBuf
@@ -66,16 +86,45 @@ func HandleCapture(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// made the capture.py script send png to stdout so no need to handle different image types
+	// capture.py writes raw pixels behind a small header, the PNG encode happens here
+	img, err := decodeFrame(&stdoutBuf)
+	if err != nil {
+		log.Printf("Failed to decode capture output %v", err)
+		http.Error(w, "Invalid image data from Python script", http.StatusInternalServerError)
+		return
+	}
+
 	w.Header().Set("Content-Type", "image/png")
 
-	_, err = io.Copy(w, &stdoutBuf)
+	// skip DEFLATE, the frame is only ~73KB and still a valid PNG
+	encoder := png.Encoder{CompressionLevel: png.NoCompression}
+	err = encoder.Encode(w, img)
 	if err != nil {
 		return
 	}
 
 }
 
+// decodeFrame reads a raw 8-bit grayscale frame as written by capture.py
+func decodeFrame(r io.Reader) (*image.Gray, error) {
+	var hdr frameHeader
+	err := binary.Read(r, binary.BigEndian, &hdr)
+	if err != nil {
+		return nil, fmt.Errorf("bad frame header: %w", err)
+	}
+	if hdr.Magic != frameMagic || hdr.Width == 0 || hdr.Height == 0 {
+		return nil, errors.New("unsupported frame header")
+	}
+
+	img := image.NewGray(image.Rect(0, 0, int(hdr.Width), int(hdr.Height)))
+	_, err = io.ReadFull(r, img.Pix)
+	if err != nil {
+		return nil, fmt.Errorf("short frame pixel data: %w", err)
+	}
+
+	return img, nil
+}
+
 func corsMiddleWare(callback func(w http.ResponseWriter, r *http.Request)) func(http.ResponseWriter, *http.Request) {
 	return func(w http.ResponseWriter, r *http.Request) {
 		w.Header().Set("Access-Control-Allow-Origin", "*")